@@ -18,39 +18,95 @@ Usage:
 """
 
 import argparse
+import bisect
+import functools
+import importlib.util
+import logging
+import operator
+import os
 import re
 import shutil
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from copy import copy
 from datetime import datetime
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
+from io import BytesIO
+from itertools import islice, zip_longest
 from pathlib import Path
+from xml.sax.saxutils import unescape
 
+import numpy as np
 import pandas as pd
-import pdfplumber
 import requests
-from openpyxl import Workbook, load_workbook
-from openpyxl.cell.cell import MergedCell
-from openpyxl.styles import Font
+from requests.adapters import HTTPAdapter
+
+# openpyxl, pdfplumber, PyMuPDF and xlsxwriter are imported inside the functions
+# that need them, so commands like find-pdfs don't pay their import cost
+
+# pdfminer's debug logging makes pdfplumber extraction dramatically slower
+logging.getLogger('pdfminer').setLevel(logging.WARNING)
+
+# With --quiet, per-item progress is replaced by a summary line every N items
+PROGRESS_INTERVAL = 50
+
+# python-calamine is a Rust xlsx reader; pandas falls back to openpyxl without it
+EXCEL_READ_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else 'openpyxl'
 
 
 # =============================================================================
 # PDF URL Finder (from find_ranges_smart.py)
 # =============================================================================
 
+def create_session():
+    """Create a keep-alive session for probing fedex.com."""
+    session = requests.Session()
+    # Each probe thread owns its session, so one host connection is all it needs
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': 'Mozilla/5.0'})
+    return session
+
+
+# Sessions aren't guaranteed thread-safe, so each probe thread keeps its own;
+# every thread still reuses its TCP/TLS connection to fedex.com across probes
+SESSION_LOCAL = threading.local()
+
+
+def get_session():
+    """Return this thread's probe session, creating it on first use."""
+    session = getattr(SESSION_LOCAL, 'session', None)
+    if session is None:
+        session = SESSION_LOCAL.session = create_session()
+    return session
+
+
 def check_url(url, timeout=8):
     """Check if a URL exists."""
     try:
-        response = requests.head(url, timeout=timeout, allow_redirects=False,
-                                 headers={'User-Agent': 'Mozilla/5.0'})
+        response = get_session().head(url, timeout=timeout, allow_redirects=False)
         return response.status_code == 200
     except Exception:
         return False
 
 
-def find_range_containing(postal_code):
-    """Find the PDF range that contains a given postal code."""
+# Shared across calls so probe threads are reused between postal codes
+URL_PROBE_POOL = ThreadPoolExecutor(max_workers=32)
+
+
+def find_range_containing(postal_code, probed=None, min_lower=0):
+    """Find the PDF range that contains a given postal code.
+
+    probed maps already-checked URLs to their result; pass the same dict for
+    every postal code so known hits and misses are not probed again.
+    min_lower skips starting points inside an already-found range below.
+    """
     pc = int(postal_code)
+    if probed is None:
+        probed = {}
 
     # Try different starting points near the postal code
     possible_lowers = []
@@ -59,21 +115,45 @@ def find_range_containing(postal_code):
     base = (pc // 100) * 100
     for offset in range(0, 2000, 100):
         lower = base - offset
-        if lower >= 0:
+        if lower >= min_lower:
             possible_lowers.append(lower)
 
-    # For each possible lower, try different upper bounds
-    sizes = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
-
+    # For each possible lower, try sizes (up to 1000) whose upper bound reaches pc
+    candidates = []
     for lower in possible_lowers:
-        for size in sizes:
+        min_size = ((pc - lower) // 100 + 1) * 100
+        for size in range(min_size, 1001, 100):
             upper = lower + size - 1
-            if lower <= pc <= upper:
-                url = f'https://www.fedex.com/ratetools/documents2/{lower:05d}-{upper:05d}.pdf'
-                if check_url(url):
-                    return (lower, upper, url)
+            url = f'https://www.fedex.com/ratetools/documents2/{lower:05d}-{upper:05d}.pdf'
+            candidates.append((lower, upper, url))
+
+    for lower, upper, url in candidates:
+        if probed.get(url):
+            return (lower, upper, url)
+
+    # Probe the unknown candidates concurrently and stop at the first hit
+    futures = {URL_PROBE_POOL.submit(check_url, url): (lower, upper, url)
+               for lower, upper, url in candidates if url not in probed}
+
+    result = None
+    for future in as_completed(futures):
+        lower, upper, url = futures[future]
+        probed[url] = future.result()
+        if probed[url]:
+            result = (lower, upper, url)
+            break
+
+    # Cancel queued probes, but keep answers from any that already finished
+    for future, (lower, upper, url) in futures.items():
+        if not future.cancel() and future.done():
+            probed[url] = future.result()
+
+    return result
 
-    return None
+
+def normalize_column_name(col) -> str:
+    """Lowercase a column name and drop spaces and underscores for matching."""
+    return str(col).lower().replace(' ', '').replace('_', '')
 
 
 def cmd_find_pdfs(args):
@@ -84,51 +164,69 @@ def cmd_find_pdfs(args):
         print(f"Error: Input file not found: {input_path}")
         return 1
 
-    # Load postal codes
-    df = pd.read_excel(input_path)
+    # Try common column names, ignoring case, spaces and underscores
+    postal_names = ['postalcodes', 'postalcode', 'zip']
 
-    # Try common column names
+    # One read that keeps only candidate postal code columns
+    df = pd.read_excel(input_path, usecols=lambda col: normalize_column_name(col) in postal_names,
+                       dtype=str, engine=EXCEL_READ_ENGINE)
+
+    normalized_columns = {normalize_column_name(col): col for col in df.columns}
     postal_col = None
-    for col in ['Postal Codes', 'Postal Code', 'postal_code', 'PostalCode', 'ZIP', 'zip']:
-        if col in df.columns:
-            postal_col = col
+    for name in postal_names:
+        if name in normalized_columns:
+            postal_col = normalized_columns[name]
             break
 
     if postal_col is None:
-        print(f"Error: Could not find postal code column. Available columns: {list(df.columns)}")
+        columns = pd.read_excel(input_path, nrows=0, engine=EXCEL_READ_ENGINE).columns
+        print(f"Error: Could not find postal code column. Available columns: {list(columns)}")
         return 1
 
-    postal_codes = sorted(set([int(str(pc).zfill(5)) for pc in df[postal_col].tolist()]))
+    # Load postal codes
+    postal_codes = (df[postal_col].dropna().str.zfill(5).astype(int)
+                    .drop_duplicates().sort_values().tolist())
 
     print(f"Need to find ranges for {len(postal_codes)} postal codes")
     print(f"Postal codes: {[f'{pc:05d}' for pc in postal_codes[:10]]}... to {postal_codes[-1]:05d}")
     print("=" * 60)
 
     found_ranges = {}
+    sorted_lowers = []
     postal_to_range = {}
+    probed = {}
+    verbose = not args.quiet
 
     for i, pc in enumerate(postal_codes):
-        print(f"[{i+1}/{len(postal_codes)}] Finding range for {pc:05d}...", end='', flush=True)
-
-        # Check if already covered
-        already_covered = False
-        for lower, (upper, url) in found_ranges.items():
-            if lower <= pc <= upper:
+        if verbose:
+            print(f"[{i+1}/{len(postal_codes)}] Finding range for {pc:05d}...", end='', flush=True)
+        elif (i + 1) % PROGRESS_INTERVAL == 0:
+            print(f"[{i+1}/{len(postal_codes)}] Finding ranges...")
+
+        # Check if already covered; ranges don't overlap, so only the
+        # closest range starting at or below pc can contain it
+        min_lower = 0
+        idx = bisect.bisect_right(sorted_lowers, pc) - 1
+        if idx >= 0:
+            lower = sorted_lowers[idx]
+            upper, url = found_ranges[lower]
+            if pc <= upper:
                 postal_to_range[pc] = (lower, upper)
-                print(f" already covered by {lower:05d}-{upper:05d}")
-                already_covered = True
-                break
-
-        if already_covered:
-            continue
+                if verbose:
+                    print(f" already covered by {lower:05d}-{upper:05d}")
+                continue
+            # pc's range must start after the closest range below it
+            min_lower = upper + 1
 
-        result = find_range_containing(pc)
+        result = find_range_containing(pc, probed, min_lower)
         if result:
             lower, upper, url = result
             found_ranges[lower] = (upper, url)
+            bisect.insort(sorted_lowers, lower)
             postal_to_range[pc] = (lower, upper)
-            print(f" FOUND: {lower:05d}-{upper:05d}")
-        else:
+            if verbose:
+                print(f" FOUND: {lower:05d}-{upper:05d}")
+        elif verbose:
             print(f" NOT FOUND!")
 
     print("\n" + "=" * 60)
@@ -138,8 +236,9 @@ def cmd_find_pdfs(args):
     sorted_ranges = sorted(found_ranges.items())
     urls = [url for lower, (upper, url) in sorted_ranges]
 
-    for url in urls:
-        print(url)
+    if verbose:
+        for url in urls:
+            print(url)
 
     # Save to file
     output_path = Path(args.output)
@@ -164,43 +263,73 @@ def cmd_find_pdfs(args):
 # US Zone PDF Parser (from parse_fedex_zones.py)
 # =============================================================================
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract all text from PDF using pdfplumber."""
-    text = ""
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() or ""
-    return text
+SECTION_HEADER_RE = re.compile(
+    r'(?P<contiguous>Contiguous\s+U\.S\.)|Alaska,\s*Hawaii(?P<puerto_rico>,?\s*and\s*Puerto\s*Rico)?',
+    re.IGNORECASE
+)
+CONTIGUOUS_HEADER_RE = re.compile(r'Contiguous\s+U\.S\.', re.IGNORECASE)
+ZIP_ZONE_RE = re.compile(r'(\d{5}(?:-\d{5})?)\s+(\d+|NA|\*)')
+ZIP_EXPRESS_GROUND_RE = re.compile(r'(\d{5}(?:-\d{5})?)\s+(\d+|NA|\*)\s+(\d+|NA|\*)')
+ZIP_DATA_RE = re.compile(r'\d{5}(?:-\d{5})?\s+\d+')
+FEDEX_RE = re.compile(r'fedex', re.IGNORECASE)
+ZONE_WORD_RE = re.compile(r'zone', re.IGNORECASE)
 
 
-def parse_contiguous_us(text: str) -> list:
-    """Parse the Contiguous U.S. section."""
-    results = []
-    pattern = r'(\d{5}(?:-\d{5})?)\s+(\d+|NA|\*)'
-    contiguous_match = re.search(r'Contiguous U\.S\.(.*?)Alaska,\s*Hawaii', text, re.DOTALL | re.IGNORECASE)
+def extract_text_from_pdf(pdf_path: str) -> str:
+    """Extract all text from PDF using PyMuPDF, falling back to pdfplumber."""
+    try:
+        import pymupdf
+        with pymupdf.open(pdf_path) as doc:
+            text = "".join(page.get_text("text") for page in doc)
+        # PyMuPDF can split the header into separate runs; let pdfplumber try
+        # rather than silently dropping the Contiguous section
+        if CONTIGUOUS_HEADER_RE.search(text):
+            return text
+    except Exception:
+        pass
 
-    if contiguous_match:
-        contiguous_text = contiguous_match.group(1)
-        matches = re.findall(pattern, contiguous_text)
-        for zip_range, zone in matches:
-            results.append((zip_range, zone))
+    import pdfplumber
 
-    return results
+    parts = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            # Only whitespace-separated tokens are needed, so skip layout-aware extraction
+            page_text = page.extract_text_simple()
+            if page_text:
+                parts.append(page_text)
+    # Newline-separate pages so the last row of a page can't run into the next
+    return "\n".join(parts)
+
+
+def parse_zone_sections(text: str) -> tuple:
+    """Parse the Contiguous U.S. and Alaska, Hawaii, and Puerto Rico sections."""
+    # Find both section headers in one pass, then match rows in place via pos/endpos
+    contiguous_start = contiguous_span = alaska_start = None
+
+    for match in SECTION_HEADER_RE.finditer(text):
+        if match.group('contiguous'):
+            if contiguous_start is None:
+                contiguous_start = match.end()
+        else:
+            if contiguous_start is not None and contiguous_span is None:
+                contiguous_span = (contiguous_start, match.start())
+            if match.group('puerto_rico') and alaska_start is None:
+                alaska_start = match.end()
 
+        if contiguous_span is not None and alaska_start is not None:
+            break
 
-def parse_alaska_hawaii_pr(text: str) -> list:
-    """Parse the Alaska, Hawaii, and Puerto Rico section."""
-    results = []
-    pattern = r'(\d{5}(?:-\d{5})?)\s+(\d+|NA|\*)\s+(\d+|NA|\*)'
-    alaska_match = re.search(r'Alaska,\s*Hawaii,?\s*and\s*Puerto\s*Rico(.*?)$', text, re.DOTALL | re.IGNORECASE)
+    contiguous_data = []
+    if contiguous_span is not None:
+        contiguous_data = ZIP_ZONE_RE.findall(text, *contiguous_span)
 
-    if alaska_match:
-        alaska_text = alaska_match.group(1)
-        matches = re.findall(pattern, alaska_text)
-        for zip_range, express_zone, ground_zone in matches:
-            results.append((zip_range, express_zone))
+    alaska_data = []
+    if alaska_start is not None:
+        # Columns are ZIP, Express zone, Ground zone; only Express is kept
+        alaska_data = [(zip_range, express_zone) for zip_range, express_zone, ground_zone
+                       in ZIP_EXPRESS_GROUND_RE.findall(text, alaska_start)]
 
-    return results
+    return contiguous_data, alaska_data
 
 
 def split_zip_range(zip_range: str) -> tuple:
@@ -221,11 +350,8 @@ def normalize_zone(zone: str) -> str:
 
 def validate_fedex_pdf(text: str) -> bool:
     """Validate that the PDF appears to be a FedEx zone locator."""
-    has_fedex = 'fedex' in text.lower()
-    has_zone = 'zone' in text.lower()
-    zip_pattern = r'\d{5}(?:-\d{5})?\s+\d+'
-    has_zip_data = bool(re.search(zip_pattern, text))
-    return has_fedex and has_zone and has_zip_data
+    # Case-insensitive searches on the original text avoid lowercased copies
+    return bool(FEDEX_RE.search(text) and ZONE_WORD_RE.search(text) and ZIP_DATA_RE.search(text))
 
 
 def process_us_zone_pdf(input_path: str, output_dir: str = 'outputs') -> str:
@@ -239,36 +365,39 @@ def process_us_zone_pdf(input_path: str, output_dir: str = 'outputs') -> str:
     if not validate_fedex_pdf(text):
         raise ValueError("PDF does not appear to be a valid FedEx zone locator")
 
-    contiguous_data = parse_contiguous_us(text)
-    alaska_data = parse_alaska_hawaii_pr(text)
+    contiguous_data, alaska_data = parse_zone_sections(text)
 
     if not contiguous_data and not alaska_data:
         raise ValueError("No zone data could be extracted from PDF")
 
     all_data = contiguous_data + alaska_data
 
-    rows = []
-    for zip_range, zone in all_data:
-        start_zip, end_zip = split_zip_range(zip_range)
-        normalized_zone = normalize_zone(zone)
-        rows.append({
-            'Start Postal Code': start_zip,
-            'End Postal Code': end_zip,
-            'Zone': normalized_zone
-        })
+    # Split ranges and normalize zones column-wise instead of one dict per row
+    zip_ranges, zones = (np.array(column, dtype=str) for column in zip(*all_data))
+    range_parts = np.char.partition(zip_ranges, '-')
+    start_zips = range_parts[:, 0]
+    end_zips = np.where(range_parts[:, 2] == '', start_zips, range_parts[:, 2])
+    zones = np.where(np.isin(np.char.upper(zones), ['NA', '*']), '', zones)
 
-    df = pd.DataFrame(rows)
-    df = df.sort_values('Start Postal Code').reset_index(drop=True)
+    order = np.argsort(start_zips, kind='stable')
 
     output_filename = input_path.stem + '.xlsx'
     output_path = output_dir / output_filename
 
-    with pd.ExcelWriter(str(output_path), engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Zones')
-        worksheet = writer.sheets['Zones']
-        for row in worksheet.iter_rows(min_row=2, max_row=len(df) + 1, min_col=1, max_col=2):
-            for cell in row:
-                cell.number_format = '@'
+    import xlsxwriter
+
+    # constant_memory streams each row to disk as soon as it is written
+    workbook = xlsxwriter.Workbook(str(output_path), {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Zones')
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    text_format = workbook.add_format({'num_format': '@'})
+    worksheet.set_column(0, 1, None, text_format)
+
+    worksheet.write_row(0, 0, ['Start Postal Code', 'End Postal Code', 'Zone'], header_format)
+    for row_idx, row in enumerate(zip(start_zips[order], end_zips[order], zones[order]), start=1):
+        worksheet.write_row(row_idx, 0, row)
+
+    workbook.close()
 
     return str(output_path)
 
@@ -290,7 +419,7 @@ def cmd_parse_us_zones(args):
             return 1
     elif input_path.is_dir():
         # Directory of PDFs
-        pdf_files = list(input_path.glob('*.pdf'))
+        pdf_files = [p for p in input_path.iterdir() if p.suffix.lower() == '.pdf' and p.is_file()]
         archive_dir = input_path / 'archive'
         failed_dir = input_path / 'failed_parsing'
 
@@ -304,20 +433,36 @@ def cmd_parse_us_zones(args):
         print(f"Found {len(pdf_files)} PDF file(s) to process")
         success_count = 0
         failed_count = 0
-
-        for pdf_path in pdf_files:
-            print(f"Processing: {pdf_path.name}")
-            try:
-                output_path = process_us_zone_pdf(str(pdf_path), str(output_dir))
-                print(f"  Output: {output_path}")
-                shutil.move(str(pdf_path), str(archive_dir / pdf_path.name))
-                print(f"  Moved to: {archive_dir / pdf_path.name}")
-                success_count += 1
-            except Exception as e:
-                print(f"  ERROR: {e}")
-                shutil.move(str(pdf_path), str(failed_dir / pdf_path.name))
-                print(f"  Moved to: {failed_dir / pdf_path.name}")
-                failed_count += 1
+        verbose = not args.quiet
+
+        # Parse in worker processes; archive moves stay in this process.
+        # archive/ and failed_parsing/ live under input_path, so a rename suffices.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(process_us_zone_pdf, str(pdf_path), str(output_dir)): pdf_path
+                for pdf_path in pdf_files
+            }
+
+            for i, future in enumerate(as_completed(futures)):
+                pdf_path = futures[future]
+                if verbose:
+                    print(f"Processed: {pdf_path.name}")
+                elif (i + 1) % PROGRESS_INTERVAL == 0:
+                    print(f"[{i+1}/{len(pdf_files)}] PDFs processed")
+                try:
+                    output_path = future.result()
+                    os.replace(pdf_path, archive_dir / pdf_path.name)
+                    if verbose:
+                        print(f"  Output: {output_path}")
+                        print(f"  Moved to: {archive_dir / pdf_path.name}")
+                    success_count += 1
+                except Exception as e:
+                    if not verbose:
+                        print(f"Failed: {pdf_path.name}")
+                    print(f"  ERROR: {e}")
+                    os.replace(pdf_path, failed_dir / pdf_path.name)
+                    print(f"  Moved to: {failed_dir / pdf_path.name}")
+                    failed_count += 1
 
         print("=" * 40)
         print(f"Complete: {success_count} succeeded, {failed_count} failed")
@@ -337,6 +482,16 @@ ZONE_CODES = [
     'DU', 'DV', 'DW', 'DX', 'DY', 'DZ'
 ]
 
+ZONE_CODE_INDEX = {zone_code: i for i, zone_code in enumerate(ZONE_CODES)}
+DEFAULT_NUMERICAL_ZONE = 16
+
+FSA_RE = re.compile(r'[A-Z]\d[A-Z]')
+ZONE_CODE_RE = re.compile(r'D[A-Z]')
+FSA_RANGE_RE = re.compile(r'([A-Z]\d[A-Z])\s*[—–-]\s*([A-Z]\d[A-Z])\s+(D[A-Z])')
+WEIGHT_RE = re.compile(r'(\d+)\s*lbs?\.?')
+RATE_STRIP_TABLE = str.maketrans('', '', '$, ')
+RATE_NUMBER_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
 SERVICE_DEFINITIONS = [
     {"name": "FedEx First Overnight", "search": "FedEx First Overnight", "page_count": 4, "is_freight": False},
     {"name": "FedEx Priority Overnight", "search": "FedEx Priority Overnight", "page_count": 4, "is_freight": False},
@@ -347,34 +502,56 @@ SERVICE_DEFINITIONS = [
 ]
 
 
-def detect_service_pages(pdf):
+def extract_page_texts(pdf_path, pdf) -> list:
+    """Extract each page's plain text for keyword searches using PyMuPDF, falling back to pdfplumber."""
+    try:
+        import pymupdf
+        with pymupdf.open(pdf_path) as doc:
+            # sort=True puts blocks in reading order so titles stay on the first lines
+            page_texts = [page.get_text("text", sort=True) for page in doc]
+        # Separate text runs come back padded with extra spaces; collapse them per line
+        # so phrase checks see single spaces, as with pdfplumber
+        return ['\n'.join(' '.join(line.split()) for line in text.split('\n')) for text in page_texts]
+    except Exception:
+        pass
+
+    return [page.extract_text() or "" for page in pdf.pages]
+
+
+def detect_service_pages(page_texts):
     """Dynamically detect page ranges for each service."""
-    services = []
+    candidates = {service_def["name"]: [] for service_def in SERVICE_DEFINITIONS}
+
+    # Collect every page whose title area names each service in one pass over the pages
+    for i, text in enumerate(page_texts):
+        # Slice off the first five lines without splitting (and copying) the rest of the page
+        title_end = -1
+        for _ in range(5):
+            title_end = text.find('\n', title_end + 1)
+            if title_end == -1:
+                break
+        title_area = text if title_end == -1 else text[:title_end]
 
-    for service_def in SERVICE_DEFINITIONS:
-        search_term = service_def["search"]
-        start_page = None
+        if "Rates" not in title_area:
+            continue
 
-        for i, page in enumerate(pdf.pages):
-            text = page.extract_text() or ""
-            lines = text.split('\n')
+        title_lines = title_area.split('\n')
 
-            title_found = False
-            for line in lines[:5]:
-                if search_term in line and "Rates" in line:
-                    title_found = True
-                    break
+        for service_def in SERVICE_DEFINITIONS:
+            search_term = service_def["search"]
+            if any(search_term in line and "Rates" in line for line in title_lines):
+                candidates[service_def["name"]].append(i)
 
-            if title_found:
-                already_assigned = False
-                for s in services:
-                    if s["pages"][0] <= i <= s["pages"][1]:
-                        already_assigned = True
-                        break
+    # Assign in definition order, as earlier services' page ranges block later ones
+    services = []
 
-                if not already_assigned:
-                    start_page = i
-                    break
+    for service_def in SERVICE_DEFINITIONS:
+        start_page = None
+
+        for i in candidates[service_def["name"]]:
+            if not any(s["pages"][0] <= i <= s["pages"][1] for s in services):
+                start_page = i
+                break
 
         if start_page is not None:
             end_page = start_page + service_def["page_count"] - 1
@@ -387,13 +564,14 @@ def detect_service_pages(pdf):
     return services
 
 
-def find_zone_index_pages(pdf):
+def find_zone_index_pages(page_texts):
     """Find the pages containing the Zone Index tables."""
     postal_code_page = None
     zone_matrix_page = None
 
-    for i, page in enumerate(pdf.pages):
-        text = page.extract_text() or ""
+    for i, text in enumerate(page_texts):
+        # The phrases may be split over lines depending on the extractor
+        text = ' '.join(text.split())
 
         if "Postal Code Zone Index" in text and postal_code_page is None:
             postal_code_page = i
@@ -401,6 +579,9 @@ def find_zone_index_pages(pdf):
         if "Intra-Canada Zone Index" in text and zone_matrix_page is None:
             zone_matrix_page = i
 
+        if postal_code_page is not None and zone_matrix_page is not None:
+            break
+
     return postal_code_page, zone_matrix_page
 
 
@@ -409,19 +590,20 @@ def parse_postal_code_to_zone_mapping(pdf, postal_code_page):
     if postal_code_page is None:
         return {}
 
-    page = pdf.pages[postal_code_page]
-    text = page.extract_text() or ""
+    # The range parsing relies on pdfplumber's layout-aware line order
+    text = pdf.pages[postal_code_page].extract_text() or ""
 
     postal_zone_map = {}
 
-    range_pattern = re.compile(r'([A-Z]\d[A-Z])\s*[—–-]\s*([A-Z]\d[A-Z])\s+(D[A-Z])')
-
-    for match in range_pattern.finditer(text):
+    for match in FSA_RANGE_RE.finditer(text):
         start_postal = match.group(1)
         end_postal = match.group(2)
         zone_code = match.group(3)
         postal_zone_map[(start_postal, end_postal)] = zone_code
 
+    # Single FSAs added below always have start == end, so this set never goes stale
+    distinct_range_starts = {start for start, end in postal_zone_map if start != end}
+
     lines = text.split('\n')
     for line in lines:
         if 'Postal Code' in line and 'Zone' in line:
@@ -431,18 +613,13 @@ def parse_postal_code_to_zone_mapping(pdf, postal_code_page):
         i = 0
         while i < len(parts):
             part = parts[i]
-            if re.match(r'^[A-Z]\d[A-Z]$', part):
-                if i + 1 < len(parts) and re.match(r'^D[A-Z]$', parts[i + 1]):
+            if FSA_RE.fullmatch(part):
+                if i + 1 < len(parts) and ZONE_CODE_RE.fullmatch(parts[i + 1]):
                     zone_code = parts[i + 1]
                     if i > 0 and parts[i - 1] in ['—', '–', '-']:
                         i += 2
                         continue
-                    already_covered = False
-                    for (start, end), _ in postal_zone_map.items():
-                        if start == part and end != part:
-                            already_covered = True
-                            break
-                    if not already_covered:
+                    if part not in distinct_range_starts:
                         postal_zone_map[(part, part)] = zone_code
             i += 1
 
@@ -450,18 +627,20 @@ def parse_postal_code_to_zone_mapping(pdf, postal_code_page):
 
 
 def parse_zone_matrix(pdf, zone_matrix_page):
-    """Parse the Intra-Canada Zone Index matrix."""
+    """Parse the Intra-Canada Zone Index matrix into an origin x destination array (-1 = missing)."""
+    # int64 holds any zone value the old dict did; the matrix is only 26 x 26
+    zone_matrix = np.full((len(ZONE_CODES), len(ZONE_CODES)), -1, dtype=np.int64)
+
     if zone_matrix_page is None:
-        return {}
+        return zone_matrix
 
     page = pdf.pages[zone_matrix_page]
     tables = page.extract_tables()
 
     if not tables:
-        return {}
+        return zone_matrix
 
     zone_table = max(tables, key=lambda t: len(t))
-    zone_matrix = {}
     dest_zones = ZONE_CODES.copy()
 
     for row_idx, row in enumerate(zone_table):
@@ -503,12 +682,50 @@ def parse_zone_matrix(pdf, zone_matrix_page):
                     continue
 
             if len(values) == len(dest_zones):
-                for j, dest_zone in enumerate(dest_zones):
-                    zone_matrix[(origin_zone, dest_zone)] = values[j]
+                zone_matrix[ZONE_CODE_INDEX[origin_zone]] = values
 
     return zone_matrix
 
 
+def build_fsa_index(postal_zone_map):
+    """Build sorted parallel (starts, ends, zones, overlapping) lists for bisecting FSA ranges."""
+    entries = sorted(postal_zone_map.items())
+    starts = [start_postal for (start_postal, end_postal), zone_code in entries]
+    ends = [end_postal for (start_postal, end_postal), zone_code in entries]
+    zones = [zone_code for (start_postal, end_postal), zone_code in entries]
+
+    # A lone FSA inside a range can survive parsing, so ranges may overlap; lookups
+    # then need the map's own order, where the first matching range wins
+    overlapping = None
+    max_end = None
+    for start_postal, end_postal in zip(starts, ends):
+        if max_end is not None and start_postal <= max_end:
+            overlapping = list(postal_zone_map.items())
+            break
+        max_end = end_postal if max_end is None else max(max_end, end_postal)
+
+    return starts, ends, zones, overlapping
+
+
+def lookup_zone_code(postal_code, fsa_index):
+    """Find which zone code a postal code maps to using a build_fsa_index index."""
+    fsa = postal_code[:3].upper()
+    starts, ends, zones, overlapping = fsa_index
+
+    if overlapping is not None:
+        for (start_postal, end_postal), zone_code in overlapping:
+            if start_postal <= fsa <= end_postal:
+                return zone_code
+        return None
+
+    # Ranges don't overlap, so only the last range starting at or before fsa can hold it
+    idx = bisect.bisect_right(starts, fsa) - 1
+    if idx >= 0 and fsa <= ends[idx]:
+        return zones[idx]
+
+    return None
+
+
 def get_zone_code_for_postal(postal_code, postal_zone_map):
     """Find which zone code a postal code maps to."""
     fsa = postal_code[:3].upper()
@@ -522,7 +739,8 @@ def get_zone_code_for_postal(postal_code, postal_zone_map):
 
 def generate_zones_data(origin_postal, postal_zone_map, zone_matrix):
     """Generate zone data for all destination postal codes."""
-    origin_zone = get_zone_code_for_postal(origin_postal, postal_zone_map)
+    fsa_index = build_fsa_index(postal_zone_map)
+    origin_zone = lookup_zone_code(origin_postal, fsa_index)
 
     if origin_zone is None:
         print(f"Warning: Could not find zone code for origin postal code: {origin_postal}")
@@ -530,38 +748,41 @@ def generate_zones_data(origin_postal, postal_zone_map, zone_matrix):
 
     print(f"  Origin postal code {origin_postal} maps to zone {origin_zone}")
 
-    zones_data = []
-
-    for (start_postal, end_postal), dest_zone_code in sorted(postal_zone_map.items()):
-        matrix_key = (origin_zone, dest_zone_code)
-        if matrix_key in zone_matrix:
-            numerical_zone = zone_matrix[matrix_key]
-        else:
-            numerical_zone = 16
+    starts, ends, dest_zone_codes, overlapping = fsa_index
 
-        zones_data.append((
-            "Canada",
-            "CA",
-            numerical_zone,
-            "",
-            start_postal,
-            end_postal
-        ))
+    # Gather every destination's zone from the origin's matrix row in one step
+    dest_idx = np.array([ZONE_CODE_INDEX[code] for code in dest_zone_codes], dtype=np.intp)
+    numerical_zones = zone_matrix[ZONE_CODE_INDEX[origin_zone], dest_idx]
+    numerical_zones = np.where(numerical_zones < 0, DEFAULT_NUMERICAL_ZONE, numerical_zones).tolist()
 
-    return zones_data
+    # The index is already sorted by postal range, which keeps the sheet in order
+    return [
+        ("Canada", "CA", numerical_zone, "", start_postal, end_postal)
+        for start_postal, end_postal, numerical_zone in zip(starts, ends, numerical_zones)
+    ]
 
 
 def clean_rate(value):
     """Clean a rate value string and convert to Decimal."""
     if value is None:
         return None
-    cleaned = str(value).replace('$', '').replace(',', '').replace(' ', '').strip()
-    if not cleaned or cleaned == '—' or cleaned == '-':
-        return None
-    try:
-        return Decimal(cleaned)
-    except Exception:
+    if isinstance(value, Decimal):
+        return value
+    cleaned = str(value).translate(RATE_STRIP_TABLE).strip()
+    # Checking the shape first keeps the many non-numeric tokens off the exception path
+    if not RATE_NUMBER_RE.fullmatch(cleaned):
         return None
+    return Decimal(cleaned)
+
+
+def explode_row(row):
+    """Split a table row whose cells hold several lines into one row per line."""
+    cell_lines = [[''] if cell is None else str(cell).split('\n') for cell in row]
+
+    if all(len(lines) == 1 for lines in cell_lines):
+        return [row]
+
+    return [[line.strip() for line in lines] for lines in zip_longest(*cell_lines, fillvalue='')]
 
 
 def parse_weight_from_line(line):
@@ -570,7 +791,7 @@ def parse_weight_from_line(line):
     if not line:
         return None
 
-    match = re.match(r'(\d+)\s*lbs?\.?', line)
+    match = WEIGHT_RE.match(line)
     if match:
         return int(match.group(1))
 
@@ -591,15 +812,8 @@ def parse_zone_numbers(header_text):
     if not header_text:
         return []
     parts = str(header_text).split()
-    zones = []
-    for part in parts:
-        try:
-            zone = int(part)
-            if 1 <= zone <= 16:
-                zones.append(zone)
-        except ValueError:
-            continue
-    return zones
+    zones = (int(part) for part in parts if part.isdecimal())
+    return [zone for zone in zones if 1 <= zone <= 16]
 
 
 def parse_rates_line(rates_text):
@@ -615,9 +829,41 @@ def parse_rates_line(rates_text):
     return rates
 
 
+def new_rate_matrix(max_weight):
+    """Create a (weight, zone) rate array; column 0 holds the weight for rows that exist, NaN elsewhere."""
+    return np.full((max_weight + 1, 17), np.nan)
+
+
+def fill_per_pound_rates(rates, weights, per_pound_rates, minimum_charges=None):
+    """Multiply weights by per-pound rates in exact integer units, rounding half up to the cent."""
+    weight_arr = np.array(list(weights), dtype=np.int64)
+    rates[weight_arr, 0] = weight_arr
+
+    zones = sorted(per_pound_rates)
+    if not zones:
+        return
+
+    minimums = {zone: minimum_charges[zone] for zone in zones if minimum_charges and zone in minimum_charges}
+
+    # Scale every Decimal to a shared number of decimal places so the math stays in int64
+    scale = max([2] + [-rate.as_tuple().exponent for rate in (*per_pound_rates.values(), *minimums.values())])
+    divisor = 10 ** (scale - 2)
+
+    per_lb = np.array([int(per_pound_rates[zone].scaleb(scale)) for zone in zones], dtype=np.int64)
+
+    cents = (weight_arr[:, None] * per_lb[None, :] + divisor // 2) // divisor
+    totals = cents * divisor
+
+    if minimums:
+        floors = np.array([int(minimums[zone].scaleb(scale)) if zone in minimums else 0 for zone in zones], dtype=np.int64)
+        totals = np.maximum(totals, floors[None, :])
+
+    rates[np.ix_(weight_arr, zones)] = totals / 10 ** scale
+
+
 def parse_non_freight_rates(pdf, start_page, end_page):
     """Parse rates for non-freight services."""
-    rates = {}
+    rates = new_rate_matrix(150)
     per_pound_rates = {}
 
     pages = [pdf.pages[i] for i in range(start_page, end_page + 1)]
@@ -632,27 +878,7 @@ def parse_non_freight_rates(pdf, start_page, end_page):
             for row in raw_table:
                 if not row:
                     continue
-                max_lines = 1
-                cell_lines = []
-                for cell in row:
-                    if cell is None:
-                        cell_lines.append([''])
-                    else:
-                        lines = str(cell).split('\n')
-                        cell_lines.append(lines)
-                        max_lines = max(max_lines, len(lines))
-
-                if max_lines == 1:
-                    table.append(row)
-                else:
-                    for line_idx in range(max_lines):
-                        new_row = []
-                        for lines in cell_lines:
-                            if line_idx < len(lines):
-                                new_row.append(lines[line_idx].strip())
-                            else:
-                                new_row.append('')
-                        table.append(new_row)
+                table.extend(explode_row(row))
 
             if not table:
                 continue
@@ -700,28 +926,20 @@ def parse_non_freight_rates(pdf, start_page, end_page):
                 if not rate_values:
                     continue
 
-                if weight not in rates:
-                    rates[weight] = {}
+                rates[weight, 0] = weight
 
                 for i, rate in enumerate(rate_values):
                     if i < len(zones):
-                        rates[weight][zones[i]] = rate
+                        rates[weight, zones[i]] = float(rate)
 
-    for weight in range(100, 151):
-        rates[weight] = {}
-        for zone in range(1, 17):
-            if zone in per_pound_rates:
-                rate = (Decimal(weight) * per_pound_rates[zone]).quantize(
-                    Decimal('0.01'), rounding=ROUND_HALF_UP
-                )
-                rates[weight][zone] = rate
+    fill_per_pound_rates(rates, range(100, 151), per_pound_rates)
 
     return rates
 
 
 def parse_freight_rates(pdf, start_page, end_page):
     """Parse rates for freight services."""
-    rates = {}
+    rates = new_rate_matrix(2000)
     per_pound_rates = {}
     minimum_charges = {}
 
@@ -747,27 +965,7 @@ def parse_freight_rates(pdf, start_page, end_page):
         for row in raw_table:
             if not row:
                 continue
-            max_lines = 1
-            cell_lines = []
-            for cell in row:
-                if cell is None:
-                    cell_lines.append([''])
-                else:
-                    lines = str(cell).split('\n')
-                    cell_lines.append(lines)
-                    max_lines = max(max_lines, len(lines))
-
-            if max_lines == 1:
-                table.append(row)
-            else:
-                for line_idx in range(max_lines):
-                    new_row = []
-                    for lines in cell_lines:
-                        if line_idx < len(lines):
-                            new_row.append(lines[line_idx].strip())
-                        else:
-                            new_row.append('')
-                    table.append(new_row)
+            table.extend(explode_row(row))
 
         zones = []
 
@@ -805,68 +1003,42 @@ def parse_freight_rates(pdf, start_page, end_page):
                             per_pound_rates[bracket_key][zone] = rate_values[i]
                     break
 
-    for weight in range(151, 2001):
-        rates[weight] = {}
-
-        if weight <= 299:
-            bracket_key = (151, 299)
-        elif weight <= 499:
-            bracket_key = (300, 499)
-        elif weight <= 999:
-            bracket_key = (500, 999)
-        elif weight <= 1999:
-            bracket_key = (1000, 1999)
-        else:
-            bracket_key = (2000, 2000)
-
-        if bracket_key not in per_pound_rates:
-            continue
-
-        for zone in range(1, 17):
-            if zone not in per_pound_rates[bracket_key]:
-                continue
+    for bracket_key in sorted(set(brackets.values())):
+        weights = range(bracket_key[0], bracket_key[1] + 1)
+        fill_per_pound_rates(
+            rates,
+            weights,
+            per_pound_rates.get(bracket_key, {}),
+            minimum_charges
+        )
 
-            per_lb_rate = per_pound_rates[bracket_key][zone]
-            calculated_rate = (Decimal(weight) * per_lb_rate).quantize(
-                Decimal('0.01'), rounding=ROUND_HALF_UP
-            )
+    return rates
 
-            if zone in minimum_charges:
-                calculated_rate = max(calculated_rate, minimum_charges[zone])
 
-            rates[weight][zone] = calculated_rate
+def font_cell(ws, value, font):
+    """Create a write-only cell carrying the given font."""
+    from openpyxl.cell import WriteOnlyCell
 
-    return rates
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = font
+    return cell
 
 
 def write_ca_excel(services_data, output_path, zones_data=None):
     """Write Canadian rate data to Excel file."""
-    wb = Workbook()
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    # Shared across every cell so openpyxl's style table isn't fed a new Font each time
+    title_font = Font(bold=True, size=14)
+    header_font = Font(bold=True)
 
-    if 'Sheet' in wb.sheetnames:
-        del wb['Sheet']
+    # Rows stream straight to the file; widths must be set before the first append
+    wb = Workbook(write_only=True)
 
     if zones_data:
         ws_zones = wb.create_sheet(title="Zones", index=0)
 
-        ws_zones.cell(row=1, column=1, value="Destination Zones")
-        ws_zones.cell(row=1, column=1).font = Font(bold=True, size=14)
-
-        ws_zones.cell(row=2, column=1, value="Zones should be a number from 1 to 16")
-
-        headers = ["Country Name", "Country Symbol", "Zone", "City", "Start Postal Code", "End Postal Code"]
-        for col, header in enumerate(headers, start=1):
-            ws_zones.cell(row=3, column=col, value=header)
-            ws_zones.cell(row=3, column=col).font = Font(bold=True)
-
-        for row_num, (country_name, country_symbol, zone, city, start_postal, end_postal) in enumerate(zones_data, start=4):
-            ws_zones.cell(row=row_num, column=1, value=country_name)
-            ws_zones.cell(row=row_num, column=2, value=country_symbol)
-            ws_zones.cell(row=row_num, column=3, value=zone)
-            ws_zones.cell(row=row_num, column=4, value=city)
-            ws_zones.cell(row=row_num, column=5, value=start_postal)
-            ws_zones.cell(row=row_num, column=6, value=end_postal)
-
         ws_zones.column_dimensions['A'].width = 15
         ws_zones.column_dimensions['B'].width = 15
         ws_zones.column_dimensions['C'].width = 8
@@ -874,42 +1046,44 @@ def write_ca_excel(services_data, output_path, zones_data=None):
         ws_zones.column_dimensions['E'].width = 18
         ws_zones.column_dimensions['F'].width = 18
 
+        ws_zones.append([font_cell(ws_zones, "Destination Zones", title_font)])
+
+        ws_zones.append(["Zones should be a number from 1 to 16"])
+
+        headers = ["Country Name", "Country Symbol", "Zone", "City", "Start Postal Code", "End Postal Code"]
+        ws_zones.append([font_cell(ws_zones, header, header_font) for header in headers])
+
+        for zone_row in zones_data:
+            ws_zones.append(zone_row)
+
     for service_name, rates, is_freight in services_data:
         sheet_name = service_name[:31]
         ws = wb.create_sheet(title=sheet_name)
 
-        ws.cell(row=1, column=1, value=service_name)
-        ws.cell(row=1, column=1).font = Font(bold=True, size=14)
+        ws.column_dimensions['A'].width = 12
+        for letter in "BCDEFGHIJKLMNOPQ":
+            ws.column_dimensions[letter].width = 10
 
-        ws.cell(row=2, column=1, value="Rates are specified in ($) CAD: 2025")
+        ws.append([font_cell(ws, service_name, title_font)])
 
-        ws.cell(row=3, column=1, value="Weight (lb)")
-        ws.cell(row=3, column=1).font = Font(bold=True)
-        for zone in range(1, 17):
-            ws.cell(row=3, column=zone + 1, value=f"Zone {zone}")
-            ws.cell(row=3, column=zone + 1).font = Font(bold=True)
+        ws.append(["Rates are specified in ($) CAD: 2025"])
+
+        headers = ["Weight (lb)"] + [f"Zone {zone}" for zone in range(1, 17)]
+        ws.append([font_cell(ws, header, header_font) for header in headers])
 
         if is_freight:
-            weight_range = range(151, 2001)
+            weight_rows = rates[151:2001]
         else:
-            weight_range = range(1, 151)
-
-        row_num = 4
-        for weight in weight_range:
-            if weight not in rates:
-                continue
-
-            ws.cell(row=row_num, column=1, value=weight)
+            weight_rows = rates[1:151]
 
-            for zone in range(1, 17):
-                if zone in rates[weight]:
-                    ws.cell(row=row_num, column=zone + 1, value=float(rates[weight][zone]))
+        # Keep only weights the PDF provided; missing zone rates become blank cells
+        present = weight_rows[~np.isnan(weight_rows[:, 0])]
+        cells = present.astype(object)
+        cells[np.isnan(present)] = None
+        cells[:, 0] = present[:, 0].astype(int).tolist()
 
-            row_num += 1
-
-        ws.column_dimensions['A'].width = 12
-        for col in range(2, 18):
-            ws.column_dimensions[chr(ord('A') + col - 1)].width = 10
+        for row in cells.tolist():
+            ws.append(row)
 
     wb.save(output_path)
     print(f"Saved to {output_path}")
@@ -917,6 +1091,8 @@ def write_ca_excel(services_data, output_path, zones_data=None):
 
 def cmd_parse_ca_rates(args):
     """Parse Canadian FedEx rate PDFs."""
+    import pdfplumber
+
     input_path = Path(args.input)
 
     if not input_path.exists():
@@ -929,10 +1105,13 @@ def cmd_parse_ca_rates(args):
     zones_data = None
 
     with pdfplumber.open(input_path) as pdf:
+        # Title and index detection only need raw text, so skip pdfplumber's layout analysis
+        page_texts = extract_page_texts(input_path, pdf)
+
         if args.origin:
             print("\nParsing Zone Index...")
 
-            postal_code_page, zone_matrix_page = find_zone_index_pages(pdf)
+            postal_code_page, zone_matrix_page = find_zone_index_pages(page_texts)
 
             if postal_code_page is not None:
                 print(f"  Found Postal Code Zone Index on page {postal_code_page + 1}")
@@ -948,7 +1127,7 @@ def cmd_parse_ca_rates(args):
             print(f"  Parsed {len(postal_zone_map)} postal code ranges")
 
             zone_matrix = parse_zone_matrix(pdf, zone_matrix_page)
-            print(f"  Parsed {len(zone_matrix)} zone matrix entries")
+            print(f"  Parsed {np.count_nonzero(zone_matrix >= 0)} zone matrix entries")
 
             zones_data = generate_zones_data(
                 args.origin,
@@ -957,7 +1136,7 @@ def cmd_parse_ca_rates(args):
             )
             print(f"  Generated {len(zones_data)} destination zone entries")
 
-        services = detect_service_pages(pdf)
+        services = detect_service_pages(page_texts)
 
         print("\nParsing Rate Sheets...")
         for service in services:
@@ -970,8 +1149,9 @@ def cmd_parse_ca_rates(args):
             else:
                 rates = parse_non_freight_rates(pdf, start_page, end_page)
 
-            total_rates = sum(len(zones) for zones in rates.values())
-            print(f"    Extracted {len(rates)} weights, {total_rates} rate values")
+            weight_count = np.count_nonzero(~np.isnan(rates[:, 0]))
+            total_rates = np.count_nonzero(~np.isnan(rates[:, 1:]))
+            print(f"    Extracted {weight_count} weights, {total_rates} rate values")
 
             services_data.append((service['name'], rates, service['is_freight']))
 
@@ -986,72 +1166,244 @@ def cmd_parse_ca_rates(args):
 # Rate Sheet Generator (from generate_rate_sheet.py)
 # =============================================================================
 
-def find_zone_file(postal_code: str, outputs_dir: str = 'outputs') -> Path:
-    """Find the zone xlsx file whose filename range contains the postal code."""
-    outputs_path = Path(outputs_dir)
+ZONE_FILE_COLUMNS = ['Zone', 'Start Postal Code', 'End Postal Code']
+ZONES_TAB_COLUMNS = ['Country Name', 'Country Symbol', 'Zones', 'City', 'Start Postal Code', 'End Postal Code']
 
-    postal_code = str(postal_code).zfill(5)
-    postal_int = int(postal_code)
+# Worksheet settings copied as-is from the template onto the write-only sheets
+TEMPLATE_SHEET_ATTRS = [
+    'sheet_properties', 'sheet_format', 'views', 'page_margins', 'page_setup', 'print_options',
+    'HeaderFooter', 'protection', 'auto_filter', 'conditional_formatting', 'data_validations',
+]
 
-    for zone_file in outputs_path.glob('*.xlsx'):
-        if zone_file.name.startswith('~$'):
-            continue
 
-        stem = zone_file.stem
-        if '-' not in stem:
-            continue
+def load_zone_file_index(outputs_dir: str) -> tuple:
+    """List zone xlsx files as (starts, entries, overlapping), with (start, end, path) entries sorted by start."""
+    entries = []
 
-        try:
-            start_str, end_str = stem.split('-')
-            start_range = int(start_str)
-            end_range = int(end_str)
+    if not os.path.isdir(outputs_dir):
+        return [], entries, None
+
+    # Only names are needed, and scandir yields them without a stat per entry
+    with os.scandir(outputs_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith('.xlsx') or name.startswith('~$'):
+                continue
+
+            stem = name[:-len('.xlsx')]
+            if '-' not in stem:
+                continue
 
+            try:
+                start_str, end_str = stem.split('-')
+                entries.append((int(start_str), int(end_str), Path(entry.path)))
+            except ValueError:
+                continue
+
+    # Overlapping file ranges need the listing order, where the first matching file wins
+    overlapping = None
+    max_end = None
+    for start_range, end_range, zone_file in sorted(entries):
+        if max_end is not None and start_range <= max_end:
+            overlapping = list(entries)
+            break
+        max_end = end_range if max_end is None else max(max_end, end_range)
+
+    entries.sort()
+    starts = [start_range for start_range, end_range, zone_file in entries]
+    return starts, entries, overlapping
+
+
+def find_zone_file(postal_code: str, zone_index: tuple) -> Path:
+    """Find the zone xlsx file whose filename range contains the postal code."""
+    starts, entries, overlapping = zone_index
+
+    postal_code = str(postal_code).zfill(5)
+    postal_int = int(postal_code)
+
+    if overlapping is not None:
+        for start_range, end_range, zone_file in overlapping:
             if start_range <= postal_int <= end_range:
                 return zone_file
-        except ValueError:
-            continue
+        return None
+
+    # Ranges don't overlap, so only the last one starting at or below the code can match
+    idx = bisect.bisect_right(starts, postal_int) - 1
+    if idx >= 0:
+        start_range, end_range, zone_file = entries[idx]
+        if postal_int <= end_range:
+            return zone_file
 
     return None
 
 
+def format_int_column(column: pd.Series, width: int = 0) -> pd.Series:
+    """Format a numeric column as zero-padded integer strings, with blanks as ''."""
+    mask = column.notna().to_numpy()
+    values = np.full(len(column), '', dtype=object)
+    values[mask] = column[mask].astype('int64').astype(str).str.zfill(width).to_numpy()
+    return pd.Series(values, index=column.index)
+
+
+@functools.lru_cache(maxsize=None)
 def load_zone_data(zone_file: Path, country_name: str, country_symbol: str) -> pd.DataFrame:
-    """Load zone file and add Country Name, Country Symbol columns."""
-    df = pd.read_excel(zone_file)
+    """Load zone file and add Country Name, Country Symbol columns (cached; don't modify the result)."""
+    df = pd.read_excel(zone_file, usecols=ZONE_FILE_COLUMNS, engine=EXCEL_READ_ENGINE)
 
     df['Country Name'] = country_name
     df['Country Symbol'] = country_symbol
     df['City'] = ''
 
-    df['Start Postal Code'] = df['Start Postal Code'].apply(lambda x: str(int(x)).zfill(5) if pd.notna(x) else '')
-    df['End Postal Code'] = df['End Postal Code'].apply(lambda x: str(int(x)).zfill(5) if pd.notna(x) else '')
+    df['Start Postal Code'] = format_int_column(df['Start Postal Code'], 5)
+    df['End Postal Code'] = format_int_column(df['End Postal Code'], 5)
 
-    df['Zones'] = df['Zone'].apply(lambda x: str(int(x)) if pd.notna(x) else '')
+    df['Zones'] = format_int_column(df['Zone'])
 
-    df = df[['Country Name', 'Country Symbol', 'Zones', 'City', 'Start Postal Code', 'End Postal Code']]
+    df = df[ZONES_TAB_COLUMNS]
 
     return df
 
 
-def append_to_rate_sheet(rate_sheet_path: Path, zone_data: pd.DataFrame):
-    """Load rate sheet, append zone data to Zone tab."""
-    wb = load_workbook(rate_sheet_path)
+def styled_cell(ws, source):
+    """Create a write-only cell with the value and style of a template cell."""
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=source.value)
+    if source.has_style:
+        # The named style goes first; the cell's own formatting is applied over it
+        cell.style = source.style
+        cell.font = copy(source.font)
+        cell.fill = copy(source.fill)
+        cell.border = copy(source.border)
+        cell.alignment = copy(source.alignment)
+        cell.number_format = source.number_format
+        cell.protection = copy(source.protection)
+    # Copies, since the writer sets the link's ref and binds the comment to the new cell
+    if source.hyperlink is not None:
+        cell.hyperlink = copy(source.hyperlink)
+    if source.comment is not None:
+        cell.comment = copy(source.comment)
+    return cell
+
+
+def template_image(image):
+    """Copy a template image with its anchor and size."""
+    from openpyxl.drawing.image import Image
+
+    data = image._data()
+    image.ref = BytesIO(data)
+
+    copied = Image(BytesIO(data))
+    copied.anchor = image.anchor
+    copied.width = image.width
+    copied.height = image.height
+    return copied
+
+
+def copy_template_layout(source, ws):
+    """Copy sheet settings, sizes, merges, names, tables, charts and images onto a write-only sheet."""
+    from openpyxl.worksheet.dimensions import ColumnDimension, RowDimension
+
+    for attr in TEMPLATE_SHEET_ATTRS:
+        setattr(ws, attr, getattr(source, attr))
+    ws.sheet_state = source.sheet_state
+
+    if source.print_area:
+        ws.print_area = source.print_area
+    if source.print_title_rows:
+        ws.print_title_rows = source.print_title_rows
+    if source.print_title_cols:
+        ws.print_title_cols = source.print_title_cols
+
+    for name, defined_name in source.defined_names.items():
+        ws.defined_names[name] = copy(defined_name)
+
+    # Loaded tables already carry their columns, so skip add_table's write-only warning
+    for table in source.tables.values():
+        ws.tables.add(table)
+
+    for chart in source._charts:
+        ws.add_chart(chart)
+
+    # Saving an image consumes its data, so each output gets a fresh one
+    for image in source._images:
+        ws.add_image(template_image(image))
+
+    # Dimension styles index the template's style table, so only sizes are carried over
+    for key, dim in source.column_dimensions.items():
+        ws.column_dimensions[key] = ColumnDimension(
+            ws, index=key, width=dim.width, hidden=dim.hidden, outlineLevel=dim.outlineLevel,
+            collapsed=dim.collapsed, bestFit=dim.bestFit, min=dim.min, max=dim.max,
+        )
+
+    for idx, dim in source.row_dimensions.items():
+        ws.row_dimensions[idx] = RowDimension(
+            ws, index=idx, ht=dim.ht, hidden=dim.hidden, outlineLevel=dim.outlineLevel,
+            collapsed=dim.collapsed,
+        )
 
-    if 'Zones' not in wb.sheetnames:
-        raise ValueError(f"Rate sheet does not contain a 'Zones' tab")
+    for merged in source.merged_cells.ranges:
+        ws.merged_cells.add(merged.coord)
 
-    ws = wb['Zones']
 
-    start_row = 4
+def copy_template_workbook(template, wb):
+    """Copy theme, named styles, properties, calc settings, protection and names onto a new workbook."""
+    wb.loaded_theme = template.loaded_theme
+    wb.properties = copy(template.properties)
+    wb.custom_doc_props = copy(template.custom_doc_props)
+    wb.calculation = copy(template.calculation)
+    wb.security = copy(template.security)
+    wb.views = [copy(view) for view in template.views]
+    wb.code_name = template.code_name
+    wb.epoch = template.epoch
+
+    for named_style in template._named_styles:
+        if named_style.name not in wb.named_styles:
+            wb.add_named_style(copy(named_style))
 
-    for idx, row in zone_data.iterrows():
-        ws.cell(row=start_row + idx, column=1, value=row['Country Name'])
-        ws.cell(row=start_row + idx, column=2, value=row['Country Symbol'])
-        ws.cell(row=start_row + idx, column=3, value=row['Zones'])
-        ws.cell(row=start_row + idx, column=4, value=row['City'])
-        ws.cell(row=start_row + idx, column=5, value=row['Start Postal Code'])
-        ws.cell(row=start_row + idx, column=6, value=row['End Postal Code'])
+    for name, defined_name in template.defined_names.items():
+        wb.defined_names[name] = copy(defined_name)
 
-    return wb
+
+@functools.lru_cache(maxsize=None)
+def load_template(rate_sheet_path: Path):
+    """Load the rate sheet template once per process (shared; don't modify it)."""
+    from openpyxl import load_workbook
+
+    template = load_workbook(rate_sheet_path)
+
+    if 'Zones' not in template.sheetnames:
+        raise ValueError("Rate sheet does not contain a 'Zones' tab")
+
+    return template
+
+
+def write_rate_sheet(rate_sheet_path: Path, zone_data: pd.DataFrame, output_path: Path):
+    """Write a copy of the rate sheet template with zone data in the Zones tab."""
+    from openpyxl import Workbook
+
+    template = load_template(rate_sheet_path)
+
+    # Rows stream straight to the file, so each sheet's layout goes in before its first append
+    wb = Workbook(write_only=True)
+    copy_template_workbook(template, wb)
+
+    for source in template.worksheets:
+        ws = wb.create_sheet(title=source.title)
+        copy_template_layout(source, ws)
+
+        # Zones keeps only its header rows; the zone data replaces anything below them
+        max_row = 3 if source.title == 'Zones' else None
+        for row in source.iter_rows(max_row=max_row):
+            ws.append([styled_cell(ws, cell) for cell in row])
+
+        if source.title == 'Zones':
+            for row in zone_data[ZONES_TAB_COLUMNS].itertuples(index=False, name=None):
+                ws.append(row)
+
+    wb.active = template.index(template.active)
+
+    wb.save(output_path)
 
 
 def generate_output_filename(ssl: str, client_name: str, carrier: str, carrier_account: str) -> str:
@@ -1060,8 +1412,46 @@ def generate_output_filename(ssl: str, client_name: str, carrier: str, carrier_a
     return f"{date_str}-{ssl}-{client_name}-{carrier}-{carrier_account}.xlsx"
 
 
+def process_ssl(ssl, postal_codes: list, args, zone_index: tuple) -> list:
+    """Build and save the rate sheet for one SSL, returning its log lines."""
+    log = [f"Processing SSL: {ssl}"]
+
+    all_zone_data = []
+
+    for postal_code in postal_codes:
+        postal_code = str(postal_code).zfill(5)
+
+        zone_file = find_zone_file(postal_code, zone_index)
+
+        if zone_file is None:
+            log.append(f"  Warning: No zone file found for postal code {postal_code}, skipping")
+            continue
+
+        log.append(f"  Found zone file for {postal_code}: {zone_file.name}")
+
+        zone_data = load_zone_data(zone_file, args.country_name, args.country_symbol)
+        all_zone_data.append(zone_data)
+
+    if not all_zone_data:
+        log.append(f"  Warning: No zone data collected for SSL {ssl}, skipping")
+        return log
+
+    combined_zone_data = pd.concat(all_zone_data, ignore_index=True)
+
+    output_filename = generate_output_filename(
+        ssl, args.client_name, args.carrier, args.carrier_account
+    )
+    output_path = Path(args.output) / output_filename
+    write_rate_sheet(Path(args.template), combined_zone_data, output_path)
+
+    log.append(f"  Output: {output_path} ({len(combined_zone_data)} rows)")
+    return log
+
+
 def cmd_generate(args):
     """Generate rate sheets from zone data."""
+    from openpyxl import load_workbook
+
     input_path = Path(args.ssl_file)
     rate_sheet_path = Path(args.template)
     output_dir = Path(args.output)
@@ -1076,20 +1466,23 @@ def cmd_generate(args):
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    required_cols = ['SSL', 'Postal Code']
+
     try:
-        ssl_df = pd.read_excel(input_path)
+        # A callable keeps a missing column from failing the read, so the check below reports it
+        ssl_df = pd.read_excel(input_path, usecols=lambda col: col in required_cols, engine=EXCEL_READ_ENGINE)
     except Exception as e:
         print(f"Error reading input file: {e}")
         return 1
 
-    required_cols = ['SSL', 'Postal Code']
     missing_cols = [col for col in required_cols if col not in ssl_df.columns]
     if missing_cols:
         print(f"Error: Input file missing required columns: {missing_cols}")
         return 1
 
     try:
-        wb_test = load_workbook(rate_sheet_path)
+        # Only the sheet names are needed here; workers load the full template once each
+        wb_test = load_workbook(rate_sheet_path, read_only=True)
         if 'Zones' not in wb_test.sheetnames:
             print(f"Error: Rate sheet does not contain a 'Zones' tab")
             return 1
@@ -1100,71 +1493,92 @@ def cmd_generate(args):
 
     grouped = ssl_df.groupby('SSL')
 
-    print(f"Processing {len(grouped)} SSL group(s)...")
-
-    for ssl, group in grouped:
-        print(f"Processing SSL: {ssl}")
+    # List the zone files once here rather than in every worker
+    zone_index = load_zone_file_index(args.zones_dir)
 
-        all_zone_data = []
-
-        for _, row in group.iterrows():
-            postal_code = str(row['Postal Code']).zfill(5)
-
-            zone_file = find_zone_file(postal_code, args.zones_dir)
+    print(f"Processing {len(grouped)} SSL group(s)...")
 
-            if zone_file is None:
-                print(f"  Warning: No zone file found for postal code {postal_code}, skipping")
-                continue
+    # Each SSL is independent; workers return their log lines so output stays in SSL order
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count(), len(grouped)) or 1) as executor:
+        futures = [
+            executor.submit(process_ssl, ssl, group['Postal Code'].tolist(), args, zone_index)
+            for ssl, group in grouped
+        ]
 
-            print(f"  Found zone file for {postal_code}: {zone_file.name}")
+        for future in futures:
+            print("\n".join(future.result()))
 
-            zone_data = load_zone_data(zone_file, args.country_name, args.country_symbol)
-            all_zone_data.append(zone_data)
+    print("Complete!")
+    return 0
 
-        if not all_zone_data:
-            print(f"  Warning: No zone data collected for SSL {ssl}, skipping")
-            continue
 
-        combined_zone_data = pd.concat(all_zone_data, ignore_index=True)
+# =============================================================================
+# Rate Sheet Fixer (from fix_rate_sheets.py)
+# =============================================================================
 
-        wb = append_to_rate_sheet(rate_sheet_path, combined_zone_data)
+ZONE_HEADER_RE = re.compile(r'^Zone 0(\d)$')
 
-        output_filename = generate_output_filename(
-            ssl, args.client_name, args.carrier, args.carrier_account
-        )
-        output_path = output_dir / output_filename
-        wb.save(output_path)
-        wb.close()
+# Raw xlsx XML patterns for patching header strings without loading the workbook
+SHARED_STRING_RE = re.compile(rb'<si\b[^>]*/>|<si\b[^>]*>.*?</si>', re.DOTALL)
+PLAIN_SHARED_STRING_RE = re.compile(rb'<si><t(?:\s[^>]*)?>([^<]*)</t></si>')
+SHEET_CELL_RE = re.compile(rb'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.DOTALL)
+CELL_ATTR_RE = re.compile(rb'\b(r|t)="([^"]*)"')
+SHEET_VALUE_RE = re.compile(rb'<v>(\d+)</v>')
+INLINE_STRING_RE = re.compile(rb'<is><t(?:\s[^>]*)?>([^<]*)</t></is>')
+HEADER_CELL_REF_RE = re.compile(rb'[A-Z]+3')
+MERGE_CELL_REF_RE = re.compile(rb'<mergeCell\b[^>]*\bref="([^"]+)"')
 
-        print(f"  Output: {output_path} ({len(combined_zone_data)} rows)")
+# Zones columns that together identify a duplicate row
+DEDUP_COLUMNS = frozenset(['Country Symbol', 'Zone', 'Zones', 'Start Postal Code', 'End Postal Code'])
 
-    print("Complete!")
-    return 0
 
+def fixed_zone_header(value):
+    """Return the 'Zone X' form of a 'Zone 0X' header, or None if it needs no fix."""
+    if value and isinstance(value, str):
+        match = ZONE_HEADER_RE.match(value)
+        if match:
+            return f"Zone {match.group(1)}"
+    return None
 
-# =============================================================================
-# Rate Sheet Fixer (from fix_rate_sheets.py)
-# =============================================================================
 
 def fix_zone_headers(ws) -> int:
     """Fix 'Zone 0X' -> 'Zone X' in row 3 headers."""
     fixes = 0
-    pattern = re.compile(r'^Zone 0(\d)$')
 
-    for cell in ws[3]:
-        if isinstance(cell, MergedCell):
+    # Columns of row 3 covered by a merge but not its top-left cell (openpyxl's MergedCells)
+    merged_cols = {
+        col
+        for merged in ws.merged_cells.ranges if merged.min_row <= 3 <= merged.max_row
+        for col in range(merged.min_col, merged.max_col + 1)
+        if (merged.min_row, merged.min_col) != (3, col)
+    }
+
+    header_row = next(ws.iter_rows(min_row=3, max_row=3, values_only=True), ())
+
+    for col, value in enumerate(header_row, start=1):
+        if col in merged_cols:
             continue
-        if cell.value and isinstance(cell.value, str):
-            match = pattern.match(cell.value)
-            if match:
-                cell.value = f"Zone {match.group(1)}"
-                fixes += 1
+        fixed = fixed_zone_header(value)
+        if fixed is not None:
+            ws.cell(row=3, column=col, value=fixed)
+            fixes += 1
 
     return fixes
 
 
+def unique_rows(rows: list, key_cols: list) -> list:
+    """Keep the first row for each distinct combination of the key columns."""
+    key = operator.itemgetter(*key_cols)
+    first = {}
+    for row in rows:
+        first.setdefault(key(row), row)
+    return list(first.values())
+
+
 def deduplicate_zones_tab(wb) -> int:
     """Deduplicate Zones tab."""
+    from openpyxl.cell.cell import MergedCell
+
     if 'Zones' not in wb.sheetnames:
         return 0
 
@@ -1178,61 +1592,275 @@ def deduplicate_zones_tab(wb) -> int:
     if not data:
         return 0
 
-    header_row = [cell.value for cell in ws[3]]
-    num_cols = len([h for h in header_row if h is not None])
-
-    df = pd.DataFrame(data)
-
-    col_indices = {}
-    for idx, header in enumerate(header_row):
-        if header in ['Country Symbol', 'Zone', 'Zones', 'Start Postal Code', 'End Postal Code']:
-            col_indices[header] = idx
-
-    dedup_cols = []
-    for name in ['Country Symbol', 'Zone', 'Zones', 'Start Postal Code', 'End Postal Code']:
-        if name in col_indices:
-            dedup_cols.append(col_indices[name])
+    dedup_cols = [idx for idx, cell in enumerate(ws[3]) if cell.value in DEDUP_COLUMNS]
 
     if not dedup_cols:
         return 0
 
-    original_count = len(df)
-    df_deduped = df.drop_duplicates(subset=dedup_cols, keep='first')
-    removed_count = original_count - len(df_deduped)
+    kept = unique_rows(data, dedup_cols)
+    removed_count = len(data) - len(kept)
 
     if removed_count == 0:
         return 0
 
-    for row in ws.iter_rows(min_row=4, max_row=ws.max_row):
-        for cell in row:
-            if not isinstance(cell, MergedCell):
-                cell.value = None
-
-    for row_idx, row_data in enumerate(df_deduped.values, start=4):
-        for col_idx, value in enumerate(row_data, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            if not isinstance(cell, MergedCell):
+    # Kept rows only shift up, so rows before the first duplicate need no writes
+    for row, row_data in zip(ws.iter_rows(min_row=4, max_row=3 + len(kept)), kept):
+        for cell, value in zip(row, row_data):
+            if cell.value != value and not isinstance(cell, MergedCell):
                 cell.value = value
 
+    tail_start = 4 + len(kept)
+    if ws.max_row >= tail_start:
+        # delete_rows doesn't move merged ranges, so clear cell by cell if any reach the tail
+        if any(merged.max_row >= tail_start for merged in ws.merged_cells.ranges):
+            for row in ws.iter_rows(min_row=tail_start, max_row=ws.max_row):
+                for cell in row:
+                    if not isinstance(cell, MergedCell):
+                        cell.value = None
+        else:
+            ws.delete_rows(tail_start, ws.max_row - tail_start + 1)
+
     return removed_count
 
 
-def process_fix_file(filepath: Path, output_dir: Path, processed_dir: Path) -> dict:
+def deduplicate_zone_rows(rows: list) -> tuple:
+    """Deduplicate Zones rows (header on row 3) as read by iter_rows, returning (rows, removed)."""
+    if len(rows) < 4:
+        return rows, 0
+
+    header_row = rows[2]
+    data = [row for row in rows[3:] if any(cell is not None for cell in row)]
+
+    if not data:
+        return rows, 0
+
+    dedup_cols = [idx for idx, header in enumerate(header_row) if header in DEDUP_COLUMNS]
+
+    if not dedup_cols:
+        return rows, 0
+
+    kept = unique_rows(data, dedup_cols)
+    removed_count = len(data) - len(kept)
+
+    if removed_count == 0:
+        return rows, 0
+
+    return rows[:3] + kept, removed_count
+
+
+def stream_fix_workbook(filepath: Path, output_path: Path) -> dict:
+    """Fix a rate sheet by streaming it through read-only and write-only workbooks (styles are not kept)."""
+    from openpyxl import Workbook, load_workbook
+
+    stats = {'header_fixes': 0, 'duplicates_removed': 0}
+
+    wb_in = load_workbook(filepath, read_only=True)
+    wb_out = Workbook(write_only=True)
+
+    try:
+        for ws_in in wb_in.worksheets:
+            ws_out = wb_out.create_sheet(title=ws_in.title)
+            rows = ws_in.iter_rows(values_only=True)
+
+            if ws_in.title == 'Zones':
+                rows, stats['duplicates_removed'] = deduplicate_zone_rows(list(rows))
+
+            for row_idx, row in enumerate(rows, start=1):
+                if row_idx == 3 and ws_in.title != 'Zones':
+                    fixed_row = [fixed_zone_header(value) for value in row]
+                    stats['header_fixes'] += sum(fixed is not None for fixed in fixed_row)
+                    row = [value if fixed is None else fixed for value, fixed in zip(row, fixed_row)]
+                ws_out.append(row)
+    finally:
+        wb_in.close()
+
+    wb_out.save(output_path)
+    return stats
+
+
+def scan_for_fixes(filepath: Path) -> tuple:
+    """Scan a rate sheet read-only, returning (fixable header count, whether Zones has duplicates)."""
+    from openpyxl import load_workbook
+
+    header_fixes = 0
+    has_duplicates = False
+
+    wb = load_workbook(filepath, read_only=True)
+
+    try:
+        for ws in wb.worksheets:
+            rows = ws.iter_rows(values_only=True)
+            header_row = next(islice(rows, 2, None), None)
+
+            if header_row is None:
+                continue
+
+            if ws.title != 'Zones':
+                header_fixes += sum(fixed_zone_header(value) is not None for value in header_row)
+                continue
+
+            dedup_cols = [idx for idx, header in enumerate(header_row) if header in DEDUP_COLUMNS]
+            if not dedup_cols:
+                continue
+
+            # Stop reading Zones at the first duplicate; the count comes from the real fix
+            seen = set()
+            for row in rows:
+                if all(cell is None for cell in row):
+                    continue
+                key = tuple(row[i] for i in dedup_cols)
+                if key in seen:
+                    has_duplicates = True
+                    break
+                seen.add(key)
+    finally:
+        wb.close()
+
+    return header_fixes, has_duplicates
+
+
+def worksheet_paths(zf) -> dict:
+    """Map sheet names to their worksheet XML paths inside an xlsx zip."""
+    main_ns = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+    rel_ns = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels}
+
+    paths = {}
+    for sheet in workbook.iter(f'{main_ns}sheet'):
+        target = targets[sheet.get(f'{rel_ns}id')]
+        paths[sheet.get('name')] = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+    return paths
+
+
+def patch_zone_headers_in_zip(filepath: Path, output_path: Path):
+    """Fix 'Zone 0X' headers by editing the xlsx XML directly; returns fixes, or None if unsafe."""
+    from openpyxl.utils import range_boundaries
+
+    try:
+        with zipfile.ZipFile(filepath) as zin:
+            sst = zin.read('xl/sharedStrings.xml') if 'xl/sharedStrings.xml' in zin.namelist() else b''
+            blocks = list(SHARED_STRING_RE.finditer(sst))
+
+            # Shared string index -> fixed text, for plain (non rich text) 'Zone 0X' entries
+            replacements = {}
+            for idx, block in enumerate(blocks):
+                plain = PLAIN_SHARED_STRING_RE.fullmatch(block.group())
+                if plain:
+                    fixed = fixed_zone_header(unescape(plain.group(1).decode('utf-8')))
+                    if fixed is not None:
+                        replacements[idx] = fixed
+
+            patched_parts = {}
+            fixes = 0
+            shared_refs = 0
+
+            for name, path in worksheet_paths(zin).items():
+                sheet_xml = zin.read(path)
+                refs = []
+                inline_fixes = 0
+                pieces = []
+                last = 0
+
+                for cell in SHEET_CELL_RE.finditer(sheet_xml):
+                    attrs = dict(CELL_ATTR_RE.findall(cell.group(1)))
+                    cell_type = attrs.get(b't')
+                    ref = attrs.get(b'r', b'')
+                    body = cell.group(2) or b''
+
+                    if cell_type == b's':
+                        value = SHEET_VALUE_RE.search(body)
+                        if value and int(value.group(1)) in replacements:
+                            refs.append(ref)
+                    elif cell_type == b'inlineStr' and name != 'Zones' and HEADER_CELL_REF_RE.fullmatch(ref):
+                        inline = INLINE_STRING_RE.fullmatch(body)
+                        fixed = fixed_zone_header(unescape(inline.group(1).decode('utf-8'))) if inline else None
+                        if fixed is not None:
+                            pieces.append(sheet_xml[last:cell.start(2)])
+                            pieces.append(f'<is><t>{fixed}</t></is>'.encode())
+                            last = cell.end(2)
+                            inline_fixes += 1
+
+                if not refs and not inline_fixes:
+                    continue
+
+                # A patched shared string changes every cell that uses it, so all of
+                # them must be row 3 headers outside Zones
+                if refs and (name == 'Zones' or not all(HEADER_CELL_REF_RE.fullmatch(ref) for ref in refs)):
+                    return None
+
+                # The openpyxl paths skip merged header cells; leave those sheets to them
+                for merge_ref in MERGE_CELL_REF_RE.findall(sheet_xml):
+                    min_col, min_row, max_col, max_row = range_boundaries(merge_ref.decode())
+                    # Whole-column refs have no row bounds, so they span row 3 too
+                    if min_row is None or max_row is None or min_row <= 3 <= max_row:
+                        return None
+
+                fixes += len(refs) + inline_fixes
+                shared_refs += len(refs)
+                if inline_fixes:
+                    pieces.append(sheet_xml[last:])
+                    patched_parts[path] = b''.join(pieces)
+
+            if not fixes:
+                return None
+
+            if shared_refs:
+                pieces = []
+                last = 0
+                for idx, block in enumerate(blocks):
+                    if idx in replacements:
+                        pieces.append(sst[last:block.start()])
+                        pieces.append(f'<si><t>{replacements[idx]}</t></si>'.encode())
+                        last = block.end()
+                pieces.append(sst[last:])
+                patched_parts['xl/sharedStrings.xml'] = b''.join(pieces)
+
+            # Every other part is copied as-is, keeping each entry's compression
+            with zipfile.ZipFile(output_path, 'w') as zout:
+                for info in zin.infolist():
+                    zout.writestr(info, patched_parts.get(info.filename) or zin.read(info))
+    except (KeyError, ValueError, ET.ParseError, zipfile.BadZipFile):
+        # Missing parts, malformed refs or bad XML leave the file to the openpyxl paths
+        return None
+
+    return fixes
+
+
+def process_fix_file(filepath: Path, output_dir: Path, processed_dir: Path, stream: bool = False) -> dict:
     """Process a single rate sheet file."""
+    from openpyxl import load_workbook
+
     stats = {'header_fixes': 0, 'duplicates_removed': 0, 'success': False}
 
     try:
-        wb = load_workbook(filepath)
+        output_path = output_dir / filepath.name
 
-        for sheet_name in wb.sheetnames:
-            if sheet_name != 'Zones':
-                stats['header_fixes'] += fix_zone_headers(wb[sheet_name])
+        header_fixes, has_duplicates = scan_for_fixes(filepath)
+
+        if not header_fixes and not has_duplicates:
+            # Nothing to change, so the original bytes are the cleaned file
+            shutil.copy2(filepath, output_path)
+        elif not has_duplicates and patch_zone_headers_in_zip(filepath, output_path) == header_fixes:
+            # Header-only fixes were applied to the shared strings; the rest of the file is untouched
+            stats['header_fixes'] = header_fixes
+        elif stream:
+            # Values only: styles, widths and merges are not carried over
+            stats.update(stream_fix_workbook(filepath, output_path))
+            stats['styles_dropped'] = True
+        else:
+            wb = load_workbook(filepath)
 
-        stats['duplicates_removed'] = deduplicate_zones_tab(wb)
+            for sheet_name in wb.sheetnames:
+                if sheet_name != 'Zones':
+                    stats['header_fixes'] += fix_zone_headers(wb[sheet_name])
 
-        output_path = output_dir / filepath.name
-        wb.save(output_path)
-        wb.close()
+            stats['duplicates_removed'] = deduplicate_zones_tab(wb)
+
+            wb.save(output_path)
+            wb.close()
 
         shutil.move(str(filepath), str(processed_dir / filepath.name))
 
@@ -1270,18 +1898,27 @@ def cmd_fix(args):
     total_duplicates_removed = 0
     success_count = 0
 
-    for filepath in xlsx_files:
-        print(f"Processing: {filepath.name}")
+    # Files are independent; process_fix_file catches its own errors and reports them in stats
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(process_fix_file, filepath, output_dir, processed_dir, args.stream): filepath
+            for filepath in xlsx_files
+        }
 
-        stats = process_fix_file(filepath, output_dir, processed_dir)
+        for future in as_completed(futures):
+            print(f"Processing: {futures[future].name}")
 
-        if stats['success']:
-            success_count += 1
-            total_header_fixes += stats['header_fixes']
-            total_duplicates_removed += stats['duplicates_removed']
-            print(f"  Header fixes: {stats['header_fixes']}, Duplicates removed: {stats['duplicates_removed']}")
-        else:
-            print(f"  Error: {stats.get('error', 'Unknown error')}")
+            stats = future.result()
+
+            if stats['success']:
+                success_count += 1
+                total_header_fixes += stats['header_fixes']
+                total_duplicates_removed += stats['duplicates_removed']
+                print(f"  Header fixes: {stats['header_fixes']}, Duplicates removed: {stats['duplicates_removed']}")
+                if stats.get('styles_dropped'):
+                    print("  Warning: written with --stream, cell styles, widths and merges were not kept")
+            else:
+                print(f"  Error: {stats.get('error', 'Unknown error')}")
 
     print()
     print(f"Complete! {success_count}/{len(xlsx_files)} files processed")
@@ -1297,7 +1934,29 @@ def cmd_fix(args):
 # Main CLI Entry Point
 # =============================================================================
 
-def main():
+COMMANDS = {
+    'find-pdfs': cmd_find_pdfs,
+    'parse-us-zones': cmd_parse_us_zones,
+    'parse-ca-rates': cmd_parse_ca_rates,
+    'generate': cmd_generate,
+    'fix': cmd_fix,
+}
+
+
+def positive_int(value):
+    """Argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+@functools.lru_cache(maxsize=1)
+def build_parser():
+    """Build the CLI parser once and reuse it."""
     parser = argparse.ArgumentParser(
         description='FedEx Rate Sheet Tool - Unified CLI for FedEx rate sheet operations',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1317,11 +1976,13 @@ Examples:
     find_parser = subparsers.add_parser('find-pdfs', help='Find valid PDF URLs for postal codes')
     find_parser.add_argument('--input', '-i', required=True, help='Excel file with postal codes')
     find_parser.add_argument('--output', '-o', default='valid_pdf_urls.txt', help='Output file for URLs')
+    find_parser.add_argument('--quiet', '-q', action='store_true', help='Only print progress every 50 postal codes')
 
     # parse-us-zones subcommand
     parse_us_parser = subparsers.add_parser('parse-us-zones', help='Parse US FedEx zone PDFs')
     parse_us_parser.add_argument('--input', '-i', required=True, help='PDF file or directory of PDFs')
     parse_us_parser.add_argument('--output', '-o', default='outputs', help='Output directory')
+    parse_us_parser.add_argument('--quiet', '-q', action='store_true', help='Only print failures and progress every 50 PDFs')
 
     # parse-ca-rates subcommand
     parse_ca_parser = subparsers.add_parser('parse-ca-rates', help='Parse Canadian FedEx rate PDFs')
@@ -1345,22 +2006,21 @@ Examples:
     fix_parser = subparsers.add_parser('fix', help='Clean and deduplicate rate sheets')
     fix_parser.add_argument('--input', '-i', required=True, help='Directory containing rate sheets to fix')
     fix_parser.add_argument('--output', '-o', required=True, help='Output directory for cleaned files')
+    fix_parser.add_argument('--stream', action='store_true', help='Stream files that need deduplication (low memory, but drops styles, widths and merges)')
+    fix_parser.add_argument('--workers', type=positive_int, help='Number of files to fix in parallel (default: CPU count)')
 
-    args = parser.parse_args()
-
-    if args.command == 'find-pdfs':
-        return cmd_find_pdfs(args)
-    elif args.command == 'parse-us-zones':
-        return cmd_parse_us_zones(args)
-    elif args.command == 'parse-ca-rates':
-        return cmd_parse_ca_rates(args)
-    elif args.command == 'generate':
-        return cmd_generate(args)
-    elif args.command == 'fix':
-        return cmd_fix(args)
-    else:
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    command = COMMANDS.get(args.command)
+    if command is None:
         parser.print_help()
         return 1
+    return command(args)
 
 
 if __name__ == '__main__':